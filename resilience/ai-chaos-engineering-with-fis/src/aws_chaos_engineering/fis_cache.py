@@ -9,20 +9,54 @@ import os
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, Optional, Tuple
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """Serialize cache data to indented UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson is stricter than json (e.g. non-str keys); fall back below
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json(payload: bytes) -> Any:
+    """Parse cache file contents, using orjson when installed.
+    
+    Both parsers raise ValueError on malformed input: orjson raises
+    JSONDecodeError, while json raises JSONDecodeError for bad JSON and
+    UnicodeDecodeError for bytes that are not valid UTF-8.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
 class FISCache:
     """Manages local file-based caching of FIS actions and resource types."""
     
-    def __init__(self, cache_dir: Optional[str] = None):
+    def __init__(
+        self, cache_dir: Optional[str] = None, now: Optional[Callable[[], float]] = None
+    ):
         """Initialize the FIS cache.
         
         Args:
             cache_dir: Custom cache directory path. If None, uses user's cache directory.
+            now: Clock returning the current time in seconds since the epoch, used
+                for TTL checks against cache file modification times. Defaults to
+                time.time; tests pass a shifted clock to simulate cache age.
         """
         if cache_dir:
             self.cache_dir = Path(cache_dir)
@@ -57,6 +91,9 @@ class FISCache:
         
         # Cache TTL in seconds (24 hours)
         self.cache_ttl = 24 * 60 * 60
+        
+        # Clock used for TTL checks
+        self._now = now or time.time
     
     def _get_cache_file_path(self, region: str) -> Path:
         """Get the cache file path for a specific region.
@@ -69,6 +106,17 @@ class FISCache:
         """
         return self.cache_dir / f"fis_actions_{region}.json"
     
+    def _is_mtime_fresh(self, file_mtime: float) -> bool:
+        """Check if a cache file modification time is within the TTL.
+        
+        Args:
+            file_mtime: Modification time of the cache file
+            
+        Returns:
+            True if the modification time is within the TTL
+        """
+        return (self._now() - file_mtime) < self.cache_ttl
+    
     def _is_cache_fresh(self, cache_file: Path) -> bool:
         """Check if cache file is fresh (within TTL).
         
@@ -79,15 +127,10 @@ class FISCache:
             True if cache is fresh, False if stale or doesn't exist
         """
         try:
-            if not cache_file.exists():
-                return False
-            
-            # Check file modification time
-            file_mtime = cache_file.stat().st_mtime
-            current_time = time.time()
-            
-            return (current_time - file_mtime) < self.cache_ttl
+            return self._is_mtime_fresh(cache_file.stat().st_mtime)
             
+        except FileNotFoundError:
+            return False
         except Exception as e:
             logger.warning(f"Error checking cache freshness: {e}")
             return False
@@ -95,6 +138,9 @@ class FISCache:
     def get_cache_status(self, region: str) -> str:
         """Get the status of the cache for a region.
         
+        The status comes from a single stat() of the cache file; the file
+        contents are not read or parsed.
+        
         Args:
             region: AWS region name
             
@@ -103,10 +149,12 @@ class FISCache:
         """
         cache_file = self._get_cache_file_path(region)
         
-        if not cache_file.exists():
+        try:
+            file_mtime = cache_file.stat().st_mtime
+        except OSError:
             return "empty"
         
-        if self._is_cache_fresh(cache_file):
+        if self._is_mtime_fresh(file_mtime):
             return "fresh"
         else:
             return "stale"
@@ -122,13 +170,52 @@ class FISCache:
         """
         cache_file = self._get_cache_file_path(region)
         
+        if not cache_file.exists():
+            logger.info(f"No cache file found for region {region}")
+            return None
+        
+        return self._read_cache_file(region, cache_file)
+    
+    def get_cache_snapshot(self, region: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Get cached FIS data and cache status for a region from a single stat.
+        
+        Equivalent to calling get_cached_data followed by get_cache_status.
+        
+        Args:
+            region: AWS region name
+            
+        Returns:
+            Tuple of (cached data or None, cache status 'fresh', 'stale' or 'empty')
+        """
+        cache_file = self._get_cache_file_path(region)
+        
         try:
-            if not cache_file.exists():
-                logger.info(f"No cache file found for region {region}")
-                return None
+            stat_result = cache_file.stat()
+        except OSError:
+            logger.info(f"No cache file found for region {region}")
+            return None, "empty"
+        
+        data = self._read_cache_file(region, cache_file)
+        if data is None:
+            # A corrupted cache file is removed while reading it
+            return None, self.get_cache_status(region)
+        
+        if self._is_mtime_fresh(stat_result.st_mtime):
+            return data, "fresh"
+        return data, "stale"
+    
+    def _read_cache_file(self, region: str, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Read and validate an existing cache file.
+        
+        Args:
+            region: AWS region name
+            cache_file: Path to the cache file for the region
             
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        Returns:
+            Cached data dictionary or None if the cache is invalid
+        """
+        try:
+            data = _load_json(cache_file.read_bytes())
             
             # Validate cache structure
             if not isinstance(data, dict):
@@ -142,7 +229,8 @@ class FISCache:
             
             return data
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Malformed JSON or invalid UTF-8, whichever parser is in use
             logger.error(f"Cache corruption detected for region {region}: {e}")
             # Remove corrupted cache file
             try:
@@ -155,12 +243,16 @@ class FISCache:
             logger.error(f"Error reading cache for region {region}: {e}")
             return None
     
-    def update_cache(self, region: str, fis_data: Dict[str, Any]) -> Tuple[bool, str, Optional[str]]:
+    def update_cache(
+        self, region: str, fis_data: Dict[str, Any], durable: bool = False
+    ) -> Tuple[bool, str, Optional[str]]:
         """Update the cache with fresh FIS data.
         
         Args:
             region: AWS region name
             fis_data: Fresh FIS data from AWS MCP server
+            durable: Whether to fsync the temporary file before the atomic move.
+                Off by default; the cache can always be refreshed from AWS.
             
         Returns:
             Tuple of (success, message, timestamp)
@@ -189,11 +281,15 @@ class FISCache:
             # Write atomically using temporary file
             temp_file = cache_file.with_suffix('.tmp')
             try:
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    json.dump(cache_entry, f, indent=2, ensure_ascii=False)
+                payload = _dump_json(cache_entry)
+                with open(temp_file, 'wb') as f:
+                    f.write(payload)
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
                 
                 # Atomic move
-                temp_file.replace(cache_file)
+                os.replace(temp_file, cache_file)
                 
                 logger.info(f"Successfully updated cache for region {region}")
                 return True, f"Cache updated successfully for region {region}", timestamp
@@ -85,8 +85,7 @@ def get_valid_fis_actions(region: str = "us-east-1") -> FISActionsResponse:
         logger.info(f"Getting FIS actions for region: {region}")
         
         # Get cached data and status
-        cached_data = fis_cache.get_cached_data(region)
-        cache_status = fis_cache.get_cache_status(region)
+        cached_data, cache_status = fis_cache.get_cache_snapshot(region)
         
         if cache_status == "stale":
             return FISActionsResponse(
@@ -231,8 +230,7 @@ def generate_fis_system_prompt(user_architecture: str, region: str = "us-east-1"
         logger.info(f"Generating system prompt for region: {region}")
         
         # Get cached FIS data
-        cached_data = fis_cache.get_cached_data(region)
-        cache_status = fis_cache.get_cache_status(region)
+        cached_data, cache_status = fis_cache.get_cache_snapshot(region)
         
         if cache_status in ["stale", "empty"]:
             return SystemPromptResponse(
@@ -114,8 +114,8 @@ class FISTemplateValidator:
         try:
             # Try to get cached data for common regions
             for region in ["us-east-1", "us-west-2", "eu-west-1"]:
-                cached_data = fis_cache.get_cached_data(region)
-                if cached_data and fis_cache.get_cache_status(region) == "fresh":
+                cached_data, cache_status = fis_cache.get_cache_snapshot(region)
+                if cached_data and cache_status == "fresh":
                     fis_actions = cached_data.get("fis_actions", [])
                     for action in fis_actions:
                         if isinstance(action, dict):
@@ -143,8 +143,8 @@ class FISTemplateValidator:
         try:
             # Try to get cached data for common regions
             for region in ["us-east-1", "us-west-2", "eu-west-1"]:
-                cached_data = fis_cache.get_cached_data(region)
-                if cached_data and fis_cache.get_cache_status(region) == "fresh":
+                cached_data, cache_status = fis_cache.get_cache_snapshot(region)
+                if cached_data and cache_status == "fresh":
                     resource_types = cached_data.get("resource_types", [])
                     for resource_type in resource_types:
                         if isinstance(resource_type, dict):
@@ -0,0 +1,52 @@
+"""Helpers shared by the test modules and conftest.
+
+Kept out of conftest.py, which pytest loads itself and test modules should not
+import.
+"""
+
+import ast
+import re
+from typing import FrozenSet, Set
+
+
+def phrase_pattern(phrases: FrozenSet[str]) -> re.Pattern:
+    """Compile an alternation matching any of the phrases, longest first.
+    
+    Longest-first ordering keeps a phrase that is a prefix of another from
+    shadowing it, so every phrase present in a text is found in one sweep.
+    """
+    return re.compile('|'.join(map(re.escape, sorted(phrases, key=len, reverse=True))))
+
+
+def missing_phrases(pattern: re.Pattern, phrases: FrozenSet[str], content: str) -> Set[str]:
+    """Return the phrases not found in content, using a single regex sweep."""
+    return phrases - {m.group(0) for m in pattern.finditer(content)}
+
+
+class ImportCollector(ast.NodeVisitor):
+    """Collect imported module names, including "module.name" combos.
+    
+    Imports are statements, so only statement bodies are visited and expression
+    subtrees are never entered. Nested bodies (functions, classes, try/if blocks)
+    are still visited, so an import placed inside a function is collected too.
+    """
+    
+    # Fields of statement nodes that hold nested statements
+    _BODY_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+    
+    def __init__(self):
+        self.imports = set()
+    
+    def visit_Import(self, node: ast.Import) -> None:
+        self.imports.update(alias.name for alias in node.names)
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            self.imports.add(node.module)
+            # Also check for specific imports from modules
+            self.imports.update(f"{node.module}.{alias.name}" for alias in node.names)
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        for field in self._BODY_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
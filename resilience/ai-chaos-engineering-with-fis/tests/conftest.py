@@ -0,0 +1,273 @@
+"""Shared pytest configuration for the AWS Chaos Engineering test suite.
+
+Registers Hypothesis settings profiles. Select one with the HYPOTHESIS_PROFILE
+environment variable; the randomized "local" profile is used by default. Tests
+that pin max_examples in their own @settings keep that count under every profile.
+
+Also provides session-scoped fixtures for the Kiro Power configuration files in
+power/ and for the MCP server module's imports and attributes, so they are read
+and parsed once per test run, and an in-memory FISCache for property tests that
+exercise code built on the cache rather than the cache's file handling.
+"""
+
+import ast
+import json
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+import pytest
+import yaml
+from hypothesis import HealthCheck, Phase, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+from aws_chaos_engineering.fis_cache import FISCache
+from aws_chaos_engineering.validators import FISTemplateValidator
+
+from ._helpers import ImportCollector
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml-backed, much faster
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Kiro Power configuration files (POWER.md, mcp.json, steering/) live in power/
+POWER_ROOT = Path(__file__).parent.parent / "power"
+
+# YAML frontmatter between the leading --- markers of POWER.md
+FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---\n', re.DOTALL)
+
+# Example database directory; CI persists it between runs by caching it
+HYPOTHESIS_EXAMPLES_DIR = Path(__file__).parent.parent / ".hypothesis" / "examples"
+
+# Local runs: randomized, replaying failures saved in the example database, without
+# per-example deadline timing. Every profile inherits these health check suppressions,
+# so tests doing real cache I/O or using function-scoped fixtures don't need their
+# own @settings overrides.
+settings.register_profile(
+    "local",
+    deadline=None,
+    database=DirectoryBasedExampleDatabase(str(HYPOTHESIS_EXAMPLES_DIR)),
+    suppress_health_check=[
+        HealthCheck.too_slow,
+        HealthCheck.function_scoped_fixture,
+    ],
+)
+
+# Reproducible runs: the same fixed examples every time, with no example database
+# I/O. No property calls hypothesis.target(), and the explain phase re-runs failing
+# examples to annotate them, so both phases are left out.
+settings.register_profile(
+    "fast",
+    parent=settings.get_profile("local"),
+    database=None,
+    derandomize=True,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.shrink],
+)
+
+# CI: randomized and replaying examples saved by earlier runs. Properties that don't
+# pin max_examples run 25 examples, and failures are reported unshrunk (no
+# shrink/target phases); the saved example replays on the next run.
+settings.register_profile(
+    "ci",
+    parent=settings.get_profile("local"),
+    max_examples=25,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+)
+
+# Local smoke runs: a single example for properties that don't pin max_examples
+settings.register_profile("dev", parent=settings.get_profile("fast"), max_examples=1)
+
+# Scheduled thorough runs: the CI database with a larger budget, full shrinking and
+# explained failures
+settings.register_profile(
+    "nightly",
+    parent=settings.get_profile("ci"),
+    max_examples=200,
+    phases=list(Phase),
+)
+
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "local"))
+
+
+class InMemoryFISCache(FISCache):
+    """FISCache that keeps cache entries in a dict instead of files.
+    
+    Each entry is stamped with the wall-clock time it was written, standing in
+    for the file modification time, and checked against the TTL with the cache's
+    own clock, just like the file-backed cache. The base class still sets up
+    cache_dir, which stays empty, so every instance can share one directory.
+    """
+    
+    def __init__(self, cache_dir: str, now: Optional[Callable[[], float]] = None):
+        super().__init__(cache_dir=cache_dir, now=now)
+        self._entries: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+    
+    def get_cache_snapshot(self, region: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Get the stored entry and its status, judged by its write time."""
+        entry = self._entries.get(region)
+        if entry is None:
+            return None, "empty"
+        
+        mtime, data = entry
+        return dict(data), "fresh" if self._is_mtime_fresh(mtime) else "stale"
+    
+    def get_cache_status(self, region: str) -> str:
+        """Get the cache status: 'fresh', 'stale', or 'empty'."""
+        return self.get_cache_snapshot(region)[1]
+    
+    def get_cached_data(self, region: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of the stored entry, or None."""
+        return self.get_cache_snapshot(region)[0]
+    
+    def update_cache(
+        self, region: str, fis_data: Dict[str, Any], durable: bool = False
+    ) -> Tuple[bool, str, Optional[str]]:
+        """Store fis_data the way FISCache.update_cache writes it."""
+        if not isinstance(fis_data, dict):
+            return False, "Invalid data format: expected dictionary", None
+        
+        timestamp = datetime.now(timezone.utc).isoformat()
+        self._entries[region] = (self._now(), {
+            "fis_actions": fis_data.get("fis_actions", []),
+            "resource_types": fis_data.get("resource_types", []),
+            "last_updated": timestamp,
+            "region": region,
+            "cache_ttl_hours": 24
+        })
+        return True, f"Cache updated successfully for region {region}", timestamp
+    
+    def seed(self, region: str, entry: Dict[str, Any]) -> None:
+        """Store entry as-is, as a fresh entry, without update_cache's checks and copying.
+        
+        For tests that only need code under test to see cached capabilities; the
+        caller must not mutate entry afterwards.
+        """
+        self._entries[region] = (self._now(), entry)
+    
+    def clear_cache(self, region: Optional[str] = None) -> bool:
+        """Drop the entry for region, or all entries."""
+        if region:
+            self._entries.pop(region, None)
+        else:
+            self._entries.clear()
+        return True
+
+
+@pytest.fixture(scope="session")
+def power_root() -> Path:
+    """Get the root directory of the Kiro Power."""
+    return POWER_ROOT
+
+
+@pytest.fixture(scope="session")
+def mcp_json_path(power_root: Path) -> Path:
+    """Get path to mcp.json file."""
+    return power_root / "mcp.json"
+
+
+@pytest.fixture(scope="session")
+def power_md_path(power_root: Path) -> Path:
+    """Get path to POWER.md file."""
+    return power_root / "POWER.md"
+
+
+@pytest.fixture(scope="session")
+def steering_dir(power_root: Path) -> Path:
+    """Get path to steering directory."""
+    return power_root / "steering"
+
+
+@pytest.fixture(scope="session")
+def mcp_config(mcp_json_path: Path) -> Dict[str, Any]:
+    """Load and parse mcp.json configuration."""
+    assert mcp_json_path.exists(), f"mcp.json not found at {mcp_json_path}"
+    
+    return _json_loads(mcp_json_path.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def power_md_content(power_md_path: Path) -> str:
+    """Load POWER.md content."""
+    assert power_md_path.exists(), f"POWER.md not found at {power_md_path}"
+    
+    with open(power_md_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.fixture(scope="session")
+def frontmatter_match(power_md_content: str) -> Optional[re.Match]:
+    """Match POWER.md's YAML frontmatter block, or None if it is missing."""
+    return FRONTMATTER_RE.match(power_md_content)
+
+
+@pytest.fixture(scope="session")
+def frontmatter_dict(frontmatter_match: Optional[re.Match]) -> Dict[str, Any]:
+    """Parse POWER.md frontmatter as YAML, or {} if there is none."""
+    if not frontmatter_match:
+        return {}
+    
+    return yaml.load(frontmatter_match.group(1), Loader=YamlLoader) or {}
+
+
+@pytest.fixture(scope="session")
+def server_ast_info() -> Tuple[FrozenSet[str], Tuple[Tuple[str, Any], ...]]:
+    """Scan the MCP server module once for the architecture compliance checks.
+    
+    Returns:
+        Tuple of (every module the server source imports, including "module.name"
+        combos; the server module's non-dunder attributes as (name, value) pairs)
+    """
+    import aws_chaos_engineering.server as server_module
+    
+    tree = ast.parse(Path(server_module.__file__).read_bytes(), filename=server_module.__file__)
+    collector = ImportCollector()
+    collector.visit(tree)
+    
+    attributes = tuple(
+        (name, value) for name, value in vars(server_module).items()
+        if not name.startswith('__')
+    )
+    return frozenset(collector.imports), attributes
+
+
+@pytest.fixture(scope="session")
+def validator() -> FISTemplateValidator:
+    """Stateless validator shared by every test in the session."""
+    return FISTemplateValidator()
+
+
+@pytest.fixture(scope="class")
+def cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Cache directory shared by the tests of one class."""
+    return tmp_path_factory.mktemp("fiscache")
+
+
+@pytest.fixture(scope="class")
+def cache(cache_dir: Path) -> FISCache:
+    """File-backed FIS cache shared by the tests of one class.
+    
+    Tests that need an empty cache start with clear_cache(), which unlinks the
+    cache files left by earlier tests and examples.
+    """
+    return FISCache(cache_dir=str(cache_dir))
+
+
+@pytest.fixture(scope="session")
+def in_memory_cache_factory(tmp_path_factory: pytest.TempPathFactory) -> Callable[..., InMemoryFISCache]:
+    """Create in-memory FIS caches; call it with an optional now clock."""
+    # Created once per session: the caches never write to it
+    cache_dir = str(tmp_path_factory.mktemp("in-memory-cache"))
+    
+    def create(now: Optional[Callable[[], float]] = None) -> InMemoryFISCache:
+        return InMemoryFISCache(cache_dir=cache_dir, now=now)
+    
+    return create
@@ -6,7 +6,6 @@ Validates: Requirements 5.4
 
 import tempfile
 from typing import Dict, Any
-import pytest
 from hypothesis import given, strategies as st, settings, HealthCheck
 
 from aws_chaos_engineering.fis_cache import FISCache
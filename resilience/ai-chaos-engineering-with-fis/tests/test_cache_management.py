@@ -7,15 +7,21 @@ Validates: Requirements 2.1, 2.3, 2.4
 import json
 import tempfile
 import time
-from pathlib import Path
-from datetime import datetime, timezone
-import pytest
+from functools import lru_cache
 from hypothesis import given, strategies as st, settings, HealthCheck
-from typing import Dict, Any
+from typing import Dict, Tuple
 
 from aws_chaos_engineering.fis_cache import FISCache
 
 
+@lru_cache(maxsize=None)
+def _fis_items(key: str, prefix: str, label: str, count: int) -> Tuple[Dict[str, str], ...]:
+    """Build ``count`` FIS item dicts once and reuse them across Hypothesis examples."""
+    return tuple(
+        {key: f"{prefix}-{i}", "description": f"{label} {i}"} for i in range(count)
+    )
+
+
 class TestCacheManagement:
     """Property-based tests for cache management functionality."""
     
@@ -41,14 +47,10 @@ class TestCacheManagement:
             cache = FISCache(cache_dir=temp_dir)
             
             # Generate test data
-            fis_actions = [
-                {"id": f"aws:service:action-{i}", "description": f"Test action {i}"}
-                for i in range(fis_actions_count)
-            ]
-            resource_types = [
-                {"type": f"aws:service:resource-{i}", "description": f"Test resource {i}"}
-                for i in range(resource_types_count)
-            ]
+            fis_actions = list(_fis_items("id", "aws:service:action", "Test action", fis_actions_count))
+            resource_types = list(
+                _fis_items("type", "aws:service:resource", "Test resource", resource_types_count)
+            )
             
             fis_data = {
                 "fis_actions": fis_actions,
@@ -70,10 +72,6 @@ class TestCacheManagement:
             assert cached_data["resource_types"] == resource_types, "Should preserve resource_types"
             assert "last_updated" in cached_data, "Should include last_updated timestamp"
             assert "cache_ttl_hours" in cached_data, "Should include cache_ttl_hours"
-            
-            # Verify cache file exists locally
-            cache_file = cache._get_cache_file_path(region)
-            assert cache_file.exists(), "Cache file should exist locally"
     
     @given(
         region=st.sampled_from(['us-east-1', 'us-west-2', 'eu-west-1', 'test-region']),
@@ -98,14 +96,10 @@ class TestCacheManagement:
             
             # Create initial data
             initial_data = {
-                "fis_actions": [
-                    {"id": f"aws:initial:action-{i}", "description": f"Initial action {i}"}
-                    for i in range(initial_actions_count)
-                ],
-                "resource_types": [
-                    {"type": f"aws:initial:resource-{i}", "description": f"Initial resource {i}"}
-                    for i in range(initial_actions_count)
-                ]
+                "fis_actions": list(_fis_items("id", "aws:initial:action", "Initial action", initial_actions_count)),
+                "resource_types": list(
+                    _fis_items("type", "aws:initial:resource", "Initial resource", initial_actions_count)
+                )
             }
             
             # Store initial data
@@ -117,14 +111,10 @@ class TestCacheManagement:
             
             # Create updated data
             updated_data = {
-                "fis_actions": [
-                    {"id": f"aws:updated:action-{i}", "description": f"Updated action {i}"}
-                    for i in range(updated_actions_count)
-                ],
-                "resource_types": [
-                    {"type": f"aws:updated:resource-{i}", "description": f"Updated resource {i}"}
-                    for i in range(updated_actions_count)
-                ]
+                "fis_actions": list(_fis_items("id", "aws:updated:action", "Updated action", updated_actions_count)),
+                "resource_types": list(
+                    _fis_items("type", "aws:updated:resource", "Updated resource", updated_actions_count)
+                )
             }
             
             # Update with fresh data immediately
@@ -133,15 +123,12 @@ class TestCacheManagement:
             assert timestamp2 is not None, "Should return new timestamp"
             assert timestamp2 != timestamp1, "Should have different timestamp after update"
             
-            # Verify immediate update - cache should contain new data
-            cached_data = cache.get_cached_data(region)
+            # Verify immediate update - cache should contain new data and be fresh
+            cached_data, cache_status = cache.get_cache_snapshot(region)
             assert cached_data is not None, "Should retrieve updated data immediately"
             assert cached_data["fis_actions"] == updated_data["fis_actions"], "Should contain updated fis_actions"
             assert cached_data["resource_types"] == updated_data["resource_types"], "Should contain updated resource_types"
             assert cached_data["last_updated"] == timestamp2, "Should have updated timestamp"
-            
-            # Verify cache status is fresh after immediate update
-            cache_status = cache.get_cache_status(region)
             assert cache_status == "fresh", "Cache should be fresh immediately after update"
     
     @given(
@@ -166,14 +153,10 @@ class TestCacheManagement:
             cache = FISCache(cache_dir=temp_dir)
             
             # Generate test data
-            fis_actions = [
-                {"id": f"aws:service:action-{i}", "description": f"Test action {i}"}
-                for i in range(fis_actions_count)
-            ]
-            resource_types = [
-                {"type": f"aws:service:resource-{i}", "description": f"Test resource {i}"}
-                for i in range(resource_types_count)
-            ]
+            fis_actions = list(_fis_items("id", "aws:service:action", "Test action", fis_actions_count))
+            resource_types = list(
+                _fis_items("type", "aws:service:resource", "Test resource", resource_types_count)
+            )
             
             fis_data = {
                 "fis_actions": fis_actions,
@@ -319,4 +302,65 @@ class TestCacheManagement:
             assert cached_data["resource_types"] == [], "Should return empty resource_types list"
             assert cached_data["region"] == region, "Should return correct region"
             assert cached_data["last_updated"] == timestamp, "Should return correct timestamp"
-            assert cached_data["cache_ttl_hours"] == 24, "Should have 24-hour TTL even for empty data"
\ No newline at end of file
+            assert cached_data["cache_ttl_hours"] == 24, "Should have 24-hour TTL even for empty data"
+    
+    def test_durable_cache_update_persists_data(self):
+        """Durable updates fsync the temporary file before the atomic move.
+        
+        **Feature: aws-chaos-engineering-kiro-power, Property 2: Cache Management**
+        **Validates: Requirements 2.1, 2.3**
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FISCache(cache_dir=temp_dir)
+            fis_data = {
+                "fis_actions": [{"id": "aws:ec2:stop-instances", "description": "Stop instances"}],
+                "resource_types": [{"type": "aws:ec2:instance", "description": "EC2 instance"}]
+            }
+            
+            success, message, timestamp = cache.update_cache("us-east-1", fis_data, durable=True)
+            assert success, f"Durable cache update should succeed: {message}"
+            
+            cached_data = cache.get_cached_data("us-east-1")
+            assert cached_data is not None, "Should retrieve durably written data"
+            assert cached_data["fis_actions"] == fis_data["fis_actions"], "Should preserve fis_actions"
+            assert cached_data["last_updated"] == timestamp, "Should return correct timestamp"
+            
+            cache_file = cache._get_cache_file_path("us-east-1")
+            assert not cache_file.with_suffix('.tmp').exists(), "Temporary file should be moved into place"
+    
+    def test_cached_read_reflects_external_file_changes(self):
+        """Every read returns the current file contents as a fresh, caller-owned parse.
+        
+        **Feature: aws-chaos-engineering-kiro-power, Property 2: Cache Management**
+        **Validates: Requirements 2.1, 2.3**
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FISCache(cache_dir=temp_dir)
+            fis_data = {"fis_actions": list(_fis_items("id", "aws:service:action", "Test action", 2))}
+            success, message, _ = cache.update_cache("us-east-1", fis_data)
+            assert success, f"Cache update should succeed: {message}"
+            
+            first_read = cache.get_cached_data("us-east-1")
+            first_read["region"] = "mutated-by-caller"
+            first_read["fis_actions"][0]["id"] = "mutated-by-caller"
+            first_read["fis_actions"].append({"id": "appended-by-caller"})
+            second_read = cache.get_cached_data("us-east-1")
+            assert second_read["region"] == "us-east-1", \
+                "Caller mutations should not leak into later reads"
+            assert second_read["fis_actions"] == fis_data["fis_actions"], \
+                "Mutations of nested items should not leak into later reads"
+            
+            # Rewrite the file behind the cache's back, keeping its size
+            cache_file = cache._get_cache_file_path("us-east-1")
+            original_size = cache_file.stat().st_size
+            external_data = dict(second_read, fis_actions=[
+                dict(item, id=item["id"].replace("action", "ACTION")) for item in second_read["fis_actions"]
+            ])
+            cache_file.write_bytes(json.dumps(external_data, indent=2).encode('utf-8'))
+            assert cache_file.stat().st_size == original_size, "Rewrite should keep the file size"
+            
+            assert cache.get_cached_data("us-east-1")["fis_actions"] == external_data["fis_actions"], \
+                "Should re-read the file after it changes on disk"
+            
+            cache_file.unlink()
+            assert cache.get_cached_data("us-east-1") is None, "Should notice the file was removed"
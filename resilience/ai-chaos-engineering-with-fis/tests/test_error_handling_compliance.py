@@ -4,31 +4,34 @@ Tests Property 9: Error Handling Compliance
 Validates: Requirements 6.4
 """
 
-import json
-import tempfile
+import os
 import pytest
-from hypothesis import given, strategies as st, settings
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any
 
+import aws_chaos_engineering.fis_cache as fis_cache_module
 from aws_chaos_engineering.fis_cache import FISCache
 from aws_chaos_engineering.validators import FISTemplateValidator
 
+# Minimal well-formed cache payload for the edge-case region and round-trip checks
+_VALID_FIS_DATA = {
+    "fis_actions": [{"id": "test-action"}],
+    "resource_types": [{"type": "test-resource"}]
+}
+
 
 class TestErrorHandlingCompliance:
     """Property-based tests for MCP server error handling compliance."""
     
-    @given(
-        region=st.sampled_from(['us-east-1', 'test-region']),
-        corrupt_cache_content=st.sampled_from([
-            'not json',  # Non-JSON text
-            '{"incomplete": json',  # Malformed JSON
-            '[]',  # Wrong type (array instead of object)
-        ])
-    )
-    @settings(max_examples=5)
+    @pytest.mark.parametrize("region", ['us-east-1', 'test-region'])
+    @pytest.mark.parametrize("corrupt_cache_content", [
+        'not json',  # Non-JSON text
+        '{"incomplete": json',  # Malformed JSON
+        '[]',  # Wrong type (array instead of object)
+    ])
     def test_error_handling_with_corrupted_cache(
         self, 
+        cache: FISCache,
         region: str, 
         corrupt_cache_content: str
     ):
@@ -37,19 +40,18 @@ class TestErrorHandlingCompliance:
         **Feature: aws-chaos-engineering-kiro-power, Property 9: Error Handling Compliance**
         **Validates: Requirements 6.4**
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create FIS cache with temporary directory
-            cache = FISCache(cache_dir=temp_dir)
-            cache_file = cache._get_cache_file_path(region)
-            
-            # Create corrupted cache file
-            cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                f.write(corrupt_cache_content)
+        cache_file = cache._get_cache_file_path(region)
+        
+        try:
+            # Create corrupted cache file in the pre-created shared cache directory
+            fd = os.open(str(cache_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, corrupt_cache_content.encode('utf-8'))
+            finally:
+                os.close(fd)
             
-            # Test that cache handles corruption gracefully
-            cached_data = cache.get_cached_data(region)
-            cache_status = cache.get_cache_status(region)
+            # Test that cache handles corruption gracefully (data and status in one pass)
+            cached_data, cache_status = cache.get_cache_snapshot(region)
             
             # Should handle corruption gracefully
             assert cached_data is None, "Corrupted cache should return None"
@@ -64,19 +66,21 @@ class TestErrorHandlingCompliance:
             else:
                 # Invalid JSON - file gets cleaned up, so status should be empty
                 assert cache_status == "empty", f"Cache status should be empty for invalid JSON, got: {cache_status}"
+        finally:
+            # Reset the shared cache for the next example
+            cache.clear_cache(region)
     
-    @given(
-        invalid_template=st.sampled_from([
-            None,  # None value
-            "invalid string",  # String instead of dict
-            [1, 2, 3],  # List instead of dict
-            42,  # Integer instead of dict
-            {"invalid": "structure"}  # Invalid structure without actions/targets
-        ])
-    )
-    @settings(max_examples=5)
+    @pytest.mark.parametrize("invalid_template", [
+        None,  # None value
+        "invalid string",  # String instead of dict
+        [1, 2, 3],  # List instead of dict
+        42,  # Integer instead of dict
+        {"invalid": "structure"}  # Invalid structure without actions/targets
+    ])
     def test_error_handling_with_invalid_templates(
         self, 
+        validator: FISTemplateValidator,
+        cache: FISCache,
         invalid_template: Any
     ):
         """Property 9: For any invalid template input, the validator should handle errors gracefully and return structured responses.
@@ -84,10 +88,7 @@ class TestErrorHandlingCompliance:
         **Feature: aws-chaos-engineering-kiro-power, Property 9: Error Handling Compliance**
         **Validates: Requirements 6.4**
         """
-        # Test validator directly with invalid input
-        validator = FISTemplateValidator()
-        cache = FISCache()  # Empty cache for testing
-        
+        # Test validator directly with invalid input against the (empty) shared cache
         # This should not raise an exception
         response = validator.validate_template(invalid_template, cache)
         
@@ -108,19 +109,17 @@ class TestErrorHandlingCompliance:
         assert isinstance(response["invalid_resource_types"], list), "invalid_resource_types should be a list"
         assert isinstance(response["validation_timestamp"], str), "validation_timestamp should be a string"
     
-    @given(
-        region=st.sampled_from(['us-east-1', 'test-region']),
-        invalid_fis_data=st.sampled_from([
-            None,  # None value
-            "invalid string",  # String instead of dict
-            [1, 2, 3],  # List instead of dict
-            42,  # Integer instead of dict
-            {"missing": "fields"}  # Missing required fields
-        ])
-    )
-    @settings(max_examples=5)
+    @pytest.mark.parametrize("region", ['us-east-1', 'test-region'])
+    @pytest.mark.parametrize("invalid_fis_data", [
+        None,  # None value
+        "invalid string",  # String instead of dict
+        [1, 2, 3],  # List instead of dict
+        42,  # Integer instead of dict
+        {"missing": "fields"}  # Missing required fields
+    ])
     def test_error_handling_with_invalid_cache_data(
         self, 
+        cache: FISCache,
         region: str, 
         invalid_fis_data: Any
     ):
@@ -129,10 +128,7 @@ class TestErrorHandlingCompliance:
         **Feature: aws-chaos-engineering-kiro-power, Property 9: Error Handling Compliance**
         **Validates: Requirements 6.4**
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Test cache update with invalid data directly
-            cache = FISCache(cache_dir=temp_dir)
-            
+        try:
             # This should not raise an exception
             success, message, timestamp = cache.update_cache(region, invalid_fis_data)
             
@@ -148,6 +144,9 @@ class TestErrorHandlingCompliance:
             elif not isinstance(invalid_fis_data, dict):
                 assert not success, "Should fail for non-dict data"
                 assert "Invalid data format" in message, "Should provide clear error message"
+        finally:
+            # Reset the shared cache for the next example
+            cache.clear_cache(region)
     
     def test_mcp_server_components_initialization(self):
         """Property 9: The MCP server components should initialize properly and handle errors gracefully.
@@ -167,15 +166,13 @@ class TestErrorHandlingCompliance:
         assert hasattr(server_module.fis_cache, 'get_cache_status'), "Cache should have get_cache_status method"
         assert hasattr(server_module.validator, 'validate_template'), "Validator should have validate_template method"
     
-    @given(
-        edge_case_region=st.sampled_from([
-            'us-east-1',  # Valid region
-            'test-region',  # Simple test region
-        ])
-    )
-    @settings(max_examples=3)
+    @pytest.mark.parametrize("edge_case_region", [
+        'us-east-1',  # Valid region
+        'test-region',  # Simple test region
+    ])
     def test_error_handling_with_edge_case_regions(
         self, 
+        tmp_path: Path,
         edge_case_region: str
     ):
         """Property 9: For any edge case region input, the server should handle it gracefully.
@@ -183,68 +180,76 @@ class TestErrorHandlingCompliance:
         **Feature: aws-chaos-engineering-kiro-power, Property 9: Error Handling Compliance**
         **Validates: Requirements 6.4**
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Test cache operations with edge case region directly
-            cache = FISCache(cache_dir=temp_dir)
-            
-            # Should handle edge cases gracefully
-            cached_data = cache.get_cached_data(edge_case_region)
-            cache_status = cache.get_cache_status(edge_case_region)
-            
-            # Should not raise exceptions
-            assert cached_data is None, "Should return None for non-existent cache"
-            assert cache_status == "empty", "Should return empty status for non-existent cache"
-            
-            # Test cache update with edge case region
-            valid_data = {
-                "fis_actions": [{"id": "test-action"}],
-                "resource_types": [{"type": "test-resource"}]
-            }
-            
-            success, message, timestamp = cache.update_cache(edge_case_region, valid_data)
-            assert success, f"Cache update should succeed for any region: {message}"
-            assert timestamp is not None, "Should return timestamp"
+        # Test cache operations with edge case region directly
+        cache = FISCache(cache_dir=str(tmp_path))
+        
+        # Should handle edge cases gracefully
+        cached_data = cache.get_cached_data(edge_case_region)
+        cache_status = cache.get_cache_status(edge_case_region)
+        
+        # Should not raise exceptions
+        assert cached_data is None, "Should return None for non-existent cache"
+        assert cache_status == "empty", "Should return empty status for non-existent cache"
+        
+        # Test cache update with edge case region
+        success, message, timestamp = cache.update_cache(edge_case_region, _VALID_FIS_DATA)
+        assert success, f"Cache update should succeed for any region: {message}"
+        assert timestamp is not None, "Should return timestamp"
     
-    def test_cache_error_recovery(self):
+    @pytest.mark.parametrize("use_orjson", [False, True], ids=["json", "orjson"])
+    def test_invalid_utf8_cache_file_is_removed(self, tmp_path: Path, monkeypatch, use_orjson: bool):
+        """Property 9: A cache file that is not valid UTF-8 is treated as corrupt with either JSON parser.
+        
+        **Feature: aws-chaos-engineering-kiro-power, Property 9: Error Handling Compliance**
+        **Validates: Requirements 6.4**
+        """
+        if use_orjson and not fis_cache_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(fis_cache_module, "ORJSON_AVAILABLE", use_orjson)
+        
+        cache = FISCache(cache_dir=str(tmp_path))
+        cache_file = cache._get_cache_file_path("us-east-1")
+        cache_file.write_bytes(b'{"fis_actions": ["\xff\xfe"]}')
+        
+        cached_data, cache_status = cache.get_cache_snapshot("us-east-1")
+        
+        assert cached_data is None, "Invalid UTF-8 cache should return None"
+        assert cache_status == "empty", f"Corrupt cache file should be removed, got status: {cache_status}"
+        assert not cache_file.exists(), "Corrupt cache file should be deleted"
+    
+    def test_cache_error_recovery(self, tmp_path: Path):
         """Property 9: Cache should recover gracefully from file system errors.
         
         **Feature: aws-chaos-engineering-kiro-power, Property 9: Error Handling Compliance**
         **Validates: Requirements 6.4**
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache = FISCache(cache_dir=temp_dir)
-            
-            # Test with non-existent region
-            result = cache.get_cached_data("non-existent-region")
-            assert result is None, "Should return None for non-existent cache"
-            
-            status = cache.get_cache_status("non-existent-region")
-            assert status == "empty", "Should return empty status for non-existent cache"
-            
-            # Test cache update with valid data
-            valid_data = {
-                "fis_actions": [{"id": "test-action"}],
-                "resource_types": [{"type": "test-resource"}]
-            }
-            
-            success, message, timestamp = cache.update_cache("test-region", valid_data)
-            assert success, f"Cache update should succeed: {message}"
-            assert timestamp is not None, "Should return timestamp"
-            
-            # Verify data was cached
-            cached = cache.get_cached_data("test-region")
-            assert cached is not None, "Should return cached data"
-            assert cached["fis_actions"] == valid_data["fis_actions"], "Should preserve fis_actions"
-            assert cached["resource_types"] == valid_data["resource_types"], "Should preserve resource_types"
+        cache = FISCache(cache_dir=str(tmp_path))
+        
+        # Test with non-existent region
+        result = cache.get_cached_data("non-existent-region")
+        assert result is None, "Should return None for non-existent cache"
+        
+        status = cache.get_cache_status("non-existent-region")
+        assert status == "empty", "Should return empty status for non-existent cache"
+        
+        # Test cache update with valid data
+        success, message, timestamp = cache.update_cache("test-region", _VALID_FIS_DATA)
+        assert success, f"Cache update should succeed: {message}"
+        assert timestamp is not None, "Should return timestamp"
+        
+        # Verify data was cached
+        cached = cache.get_cached_data("test-region")
+        assert cached is not None, "Should return cached data"
+        assert cached["fis_actions"] == _VALID_FIS_DATA["fis_actions"], "Should preserve fis_actions"
+        assert cached["resource_types"] == _VALID_FIS_DATA["resource_types"], "Should preserve resource_types"
     
-    def test_validator_error_handling(self):
+    def test_validator_error_handling(self, validator: FISTemplateValidator, tmp_path: Path):
         """Property 9: Validator should handle all error conditions gracefully.
         
         **Feature: aws-chaos-engineering-kiro-power, Property 9: Error Handling Compliance**
         **Validates: Requirements 6.4**
         """
-        validator = FISTemplateValidator()
-        cache = FISCache()  # Empty cache
+        cache = FISCache(cache_dir=str(tmp_path))  # Empty cache
         
         # Test with completely invalid template
         result = validator.validate_template(None, cache)
@@ -262,8 +267,7 @@ class TestErrorHandlingCompliance:
         assert isinstance(result, dict), "Should return dict for template without actions"
         
         # All results should have required fields
-        for test_result in [result]:
-            assert "valid" in test_result, "Must have valid field"
-            assert "errors" in test_result, "Must have errors field"
-            assert "warnings" in test_result, "Must have warnings field"
-            assert "validation_timestamp" in test_result, "Must have validation_timestamp field"
\ No newline at end of file
+        assert "valid" in result, "Must have valid field"
+        assert "errors" in result, "Must have errors field"
+        assert "warnings" in result, "Must have warnings field"
+        assert "validation_timestamp" in result, "Must have validation_timestamp field"
\ No newline at end of file
@@ -6,133 +6,192 @@ from user input to validated template.
 """
 
 import sys
-import os
 import json
+import shutil
 import subprocess
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+
 # Add src to path for testing
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from aws_chaos_engineering.fis_cache import FISCache
 from aws_chaos_engineering.validators import FISTemplateValidator
-from aws_chaos_engineering.server import get_valid_fis_actions, validate_fis_template, refresh_valid_fis_actions_cache
 
 
-def test_uvx_installation():
-    """Test that the package can be installed via uvx."""
-    print("Testing uvx installation...")
+SERVER_COMMAND = "aws-chaos-engineering"
+
+# Resolved once; the server tests are skipped under pytest when it is not installed
+SERVER_BINARY = shutil.which(SERVER_COMMAND)
+requires_server = pytest.mark.skipif(
+    SERVER_BINARY is None, reason=f"{SERVER_COMMAND} binary not installed"
+)
+
+# Cache contents written by the cache, validation and end-to-end checks
+_VALID_FIS_DATA = {
+    "fis_actions": [
+        {"id": "aws:ec2:stop-instances", "description": "Stop EC2 instances"}
+    ],
+    "resource_types": [
+        {"type": "aws:ec2:instance", "description": "EC2 instances"}
+    ]
+}
+
+INIT_MESSAGE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "1.0"}
+    }
+}
+
+# Newline-framed initialize request, encoded once for the binary stdin pipe
+INIT_REQUEST = json.dumps(INIT_MESSAGE).encode("utf-8") + b"\n"
+
+
+def readline_with_timeout(stream, timeout: float) -> bytes:
+    """Read one line from a pipe, giving up after timeout seconds.
     
-    try:
-        # Test if the command exists by checking if it can be found
-        result = subprocess.run(
-            ["which", "aws-chaos-engineering"] if os.name != 'nt' else ["where", "aws-chaos-engineering"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+    Unlike select(), this also works on Windows pipes.
+    
+    Args:
+        stream: Readable pipe of a subprocess
+        timeout: Maximum seconds to wait for the line
         
-        if result.returncode == 0 and result.stdout.strip():
-            print("✓ uvx installation successful")
-            return True
-        else:
-            # Fallback: try to run the command briefly
-            try:
-                process = subprocess.Popen(
-                    ["aws-chaos-engineering"],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                
-                # Give it a moment to start
-                time.sleep(1)
-                
-                if process.poll() is None:  # Process is still running
-                    process.terminate()
-                    print("✓ uvx installation successful")
-                    return True
-                else:
-                    print(f"✗ uvx installation test failed: Process exited immediately")
-                    return False
-            except Exception as e2:
-                print(f"✗ uvx installation test failed: {e2}")
-                return False
-    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError) as e:
-        print(f"✗ uvx installation test failed: {e}")
-        return False
+    Returns:
+        The raw line read, or b"" if none arrived in time
+    """
+    lines = []
+    reader = threading.Thread(target=lambda: lines.append(stream.readline()), daemon=True)
+    reader.start()
+    reader.join(timeout)
+    return lines[0] if lines else b""
 
 
-def test_mcp_server_startup():
-    """Test that the MCP server starts up correctly."""
-    print("Testing MCP server startup...")
+def start_mcp_server(timeout: float = 5.0):
+    """Spawn the MCP server and send it the JSON-RPC initialize request.
     
-    try:
-        # Test MCP server initialization with shorter timeout
-        init_message = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "test", "version": "1.0"}
-            }
-        }
+    Args:
+        timeout: Seconds to wait for the first framed response
         
-        # Start the server process
+    Returns:
+        Tuple of (process, first raw stdout line). The process is None if the
+        server could not be spawned; the line is empty if nothing arrived in time.
+    """
+    try:
         process = subprocess.Popen(
-            ["aws-chaos-engineering"],
+            [SERVER_BINARY or SERVER_COMMAND],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stderr=subprocess.DEVNULL  # Never read; an undrained pipe could stall a chatty server
         )
+    except OSError as e:
+        print(f"✗ Could not start MCP server: {e}")
+        return None, b""
+    
+    try:
+        process.stdin.write(INIT_REQUEST)
+        process.stdin.flush()
         
-        try:
-            # Send initialization message with shorter timeout
-            stdout, stderr = process.communicate(
-                input=json.dumps(init_message) + "\n",
-                timeout=5
-            )
-            
-            if "AWS Chaos Engineering" in stdout or "initialize" in stdout:
-                print("✓ MCP server startup successful")
-                return True
-            else:
-                print(f"✗ MCP server startup failed - no expected response")
-                print(f"  stdout: {stdout[:200]}...")
-                print(f"  stderr: {stderr[:200]}...")
-                return False
-        finally:
-            # Ensure process is terminated
-            if process.poll() is None:
-                process.terminate()
-                process.wait(timeout=2)
-            
-    except subprocess.TimeoutExpired:
+        # Return as soon as the first response line arrives instead of sleeping
+        return process, readline_with_timeout(process.stdout, timeout)
+    except OSError as e:
+        print(f"✗ Could not initialize MCP server: {e}")
+        return process, b""
+
+
+def exited_within(process, timeout: float) -> bool:
+    """Poll a process until it exits or timeout seconds pass.
+    
+    Args:
+        process: Running subprocess
+        timeout: Maximum seconds to wait
+        
+    Returns:
+        True as soon as the process has exited, False if it is still running at the deadline
+    """
+    deadline = time.monotonic() + timeout
+    while process.poll() is None:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+def stop_mcp_server(process) -> None:
+    """Terminate a server process started by start_mcp_server."""
+    if process is not None and process.poll() is None:
+        process.terminate()
+        process.wait(timeout=2)
+
+
+@pytest.fixture(scope="module")
+def mcp_server():
+    """Single MCP server process shared by the installation and startup tests."""
+    server = start_mcp_server()
+    yield server
+    stop_mcp_server(server[0])
+
+
+@requires_server
+def test_uvx_installation(mcp_server):
+    """Test that the package can be installed via uvx."""
+    print("Testing uvx installation...")
+    
+    process, _ = mcp_server
+    
+    if SERVER_BINARY:
+        print("✓ uvx installation successful")
+        return True
+    
+    # Fallback: the shared server process survived the initialize handshake
+    if process is not None and not exited_within(process, 1.0):
+        print("✓ uvx installation successful")
+        return True
+    
+    print("✗ uvx installation test failed: Process exited immediately")
+    return False
+
+
+@requires_server
+def test_mcp_server_startup(mcp_server):
+    """Test that the MCP server starts up correctly."""
+    print("Testing MCP server startup...")
+    
+    process, response = mcp_server
+    
+    if process is None:
+        print("✗ MCP server startup test failed: server could not be started")
+        return False
+    
+    if b"AWS Chaos Engineering" in response or b"initialize" in response:
+        print("✓ MCP server startup successful")
+        return True
+    
+    if not response and process.poll() is None:
         print("✗ MCP server startup test timed out (this may be normal for MCP servers)")
-        if process.poll() is None:
-            process.terminate()
         # Consider timeout as success since MCP servers often run indefinitely
         return True
-    except Exception as e:
-        print(f"✗ MCP server startup test failed: {e}")
-        return False
+    
+    print(f"✗ MCP server startup failed - no expected response")
+    print(f"  stdout: {response[:200].decode('utf-8', errors='replace')}...")
+    return False
 
 
-def test_cache_functionality():
+def test_cache_functionality(tmp_path):
     """Test FIS cache management functionality."""
     print("Testing cache functionality...")
     
     try:
-        cache = FISCache()
-        
-        # Clear any existing cache
-        cache.clear_cache("us-east-1")
+        cache = FISCache(cache_dir=str(tmp_path))
         
         # Test empty cache
         status = cache.get_cache_status("us-east-1")
@@ -141,16 +200,7 @@ def test_cache_functionality():
             return False
         
         # Test cache update
-        test_data = {
-            "fis_actions": [
-                {"id": "aws:ec2:stop-instances", "description": "Stop EC2 instances"}
-            ],
-            "resource_types": [
-                {"type": "aws:ec2:instance", "description": "EC2 instances"}
-            ]
-        }
-        
-        success, message, timestamp = cache.update_cache("us-east-1", test_data)
+        success, message, timestamp = cache.update_cache("us-east-1", _VALID_FIS_DATA)
         if not success:
             print(f"✗ Cache update failed: {message}")
             return False
@@ -169,22 +219,14 @@ def test_cache_functionality():
         return False
 
 
-def test_validation_functionality():
+def test_validation_functionality(tmp_path):
     """Test FIS template validation functionality."""
     print("Testing validation functionality...")
     
     try:
         # Set up cache with test data
-        cache = FISCache()
-        test_data = {
-            "fis_actions": [
-                {"id": "aws:ec2:stop-instances", "description": "Stop EC2 instances"}
-            ],
-            "resource_types": [
-                {"type": "aws:ec2:instance", "description": "EC2 instances"}
-            ]
-        }
-        cache.update_cache("us-east-1", test_data)
+        cache = FISCache(cache_dir=str(tmp_path))
+        cache.update_cache("us-east-1", _VALID_FIS_DATA)
         
         # Test valid template
         valid_template = {
@@ -237,7 +279,7 @@ def test_validation_functionality():
         return False
 
 
-def test_end_to_end_workflow():
+def test_end_to_end_workflow(tmp_path):
     """Test the complete end-to-end workflow."""
     print("Testing end-to-end workflow...")
     
@@ -246,19 +288,10 @@ def test_end_to_end_workflow():
         from aws_chaos_engineering.fis_cache import FISCache
         from aws_chaos_engineering.validators import FISTemplateValidator
         
-        cache = FISCache()
+        cache = FISCache(cache_dir=str(tmp_path))
         validator = FISTemplateValidator()
         
-        # Clear any existing cache
-        cache.clear_cache("us-east-1")
-        
-        # Step 1: Check empty cache
-        status = cache.get_cache_status("us-east-1")
-        if status != "empty":
-            print(f"✗ Expected empty cache, got: {status}")
-            return False
-        
-        # Step 2: Simulate agent refreshing cache with AWS data
+        # Step 1: Simulate agent refreshing cache with AWS data
         mock_fis_data = {
             "fis_actions": [
                 {"id": "aws:ec2:stop-instances", "description": "Stop EC2 instances"},
@@ -275,18 +308,13 @@ def test_end_to_end_workflow():
             print(f"✗ Cache refresh failed: {message}")
             return False
         
-        # Step 3: Check cache is now fresh
-        status = cache.get_cache_status("us-east-1")
-        if status != "fresh":
-            print(f"✗ Expected fresh cache, got: {status}")
-            return False
-        
+        # Step 2: Read back the refreshed data
         cached_data = cache.get_cached_data("us-east-1")
-        if len(cached_data.get("fis_actions", [])) == 0:
+        if not cached_data or len(cached_data.get("fis_actions", [])) == 0:
             print("✗ Expected FIS actions in fresh cache")
             return False
         
-        # Step 4: Validate a template
+        # Step 3: Validate a template
         test_template = {
             "actions": {
                 "StopInstances": {
@@ -315,32 +343,78 @@ def test_end_to_end_workflow():
         return False
 
 
+def test_cache_status_transitions(tmp_path):
+    """Test that the cache status moves from empty to fresh on refresh."""
+    print("Testing cache status transitions...")
+    
+    cache = FISCache(cache_dir=str(tmp_path))
+    
+    status = cache.get_cache_status("us-east-1")
+    assert status == "empty", f"Expected empty cache, got: {status}"
+    
+    success, message, timestamp = cache.update_cache("us-east-1", _VALID_FIS_DATA)
+    assert success, f"Cache refresh failed: {message}"
+    
+    status = cache.get_cache_status("us-east-1")
+    assert status == "fresh", f"Expected fresh cache, got: {status}"
+    
+    print("✓ Cache status transitions working")
+
+
 def main():
     """Run all integration tests."""
     print("AWS Chaos Engineering Kiro Power - Integration Tests")
     print("=" * 60)
     
+    # Cache tests run first, overlapping the server's startup handshake
     tests = [
-        test_uvx_installation,
-        test_mcp_server_startup,
         test_cache_functionality,
         test_validation_functionality,
-        test_end_to_end_workflow
+        test_end_to_end_workflow,
+        test_cache_status_transitions,
+        test_uvx_installation,
+        test_mcp_server_startup
     ]
+    # Tests that touch the FIS cache get their own directory, as under pytest's tmp_path
+    cache_tests = {
+        test_cache_functionality,
+        test_validation_functionality,
+        test_end_to_end_workflow,
+        test_cache_status_transitions
+    }
+    # Tests that talk to the server share one process, as under the mcp_server fixture
+    server_tests = {test_uvx_installation, test_mcp_server_startup}
     
     passed = 0
     failed = 0
     
-    for test in tests:
+    # Cache test directories live under one temporary root, removed when the run ends
+    with tempfile.TemporaryDirectory() as temp_root, ThreadPoolExecutor(max_workers=1) as executor:
+        # The server wait is I/O-bound; the disk-bound cache tests run meanwhile
+        server_future = executor.submit(start_mcp_server)
         try:
-            if test():
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"✗ Test {test.__name__} crashed: {e}")
-            failed += 1
-        print()
+            for test in tests:
+                try:
+                    if test in cache_tests:
+                        args = (Path(tempfile.mkdtemp(dir=temp_root)),)
+                    elif test in server_tests:
+                        args = (server_future.result(),)
+                    else:
+                        args = ()
+                    # Tests that assert return None; older ones return a bool
+                    if test(*args) is not False:
+                        passed += 1
+                    else:
+                        failed += 1
+                except AssertionError as e:
+                    print(f"✗ Test {test.__name__} failed: {e}")
+                    failed += 1
+                except Exception as e:
+                    print(f"✗ Test {test.__name__} crashed: {e}")
+                    failed += 1
+                print()
+        finally:
+            stop_mcp_server(server_future.result()[0])
     
     print("=" * 60)
     print(f"Tests completed: {passed} passed, {failed} failed")
@@ -5,143 +5,120 @@ Validates: Requirements 4.1
 """
 
 import re
-import yaml
-from pathlib import Path
 import pytest
-from hypothesis import given, strategies as st, assume, settings, HealthCheck
-from typing import List, Set
+from hypothesis import given, strategies as st, settings, HealthCheck
+from typing import Any, Dict, FrozenSet, Optional
 
 
-def get_required_keywords() -> Set[str]:
+# "Automatic Activation" section of POWER.md, up to the next heading
+_ACTIVATION_RE = re.compile(r'### Automatic Activation.*?(?=###|\Z)', re.DOTALL | re.IGNORECASE)
+
+# Required keywords based on requirements, built once at import time
+_REQUIRED_KEYWORDS = frozenset({
+    # Core chaos engineering terms
+    "chaos engineering", "chaos", "fault injection", "fault", "injection",
+    "resilience testing", "resilience", "reliability",
+    "failure testing", "disaster recovery testing",
+    
+    # AWS FIS specific terms  
+    "FIS", "AWS FIS", "experiment",
+    
+    # Additional related terms that should trigger activation
+    "chaos monkey", "chaos testing", "failure simulation",
+    "system resilience", "infrastructure testing"
+})
+
+# Sorted so Hypothesis draws map to the same keywords regardless of hash seed
+_REQUIRED_KEYWORDS_TUPLE = tuple(sorted(_REQUIRED_KEYWORDS))
+
+# Lowercased required keywords for case-insensitive set comparisons
+_REQUIRED_KEYWORDS_LOWER = frozenset(kw.lower() for kw in _REQUIRED_KEYWORDS)
+
+
+def get_required_keywords() -> FrozenSet[str]:
     """Get the set of required keywords based on requirements."""
-    return {
-        # Core chaos engineering terms
-        "chaos engineering", "chaos", "fault injection", "fault", "injection",
-        "resilience testing", "resilience", "reliability",
-        "failure testing", "disaster recovery testing",
-        
-        # AWS FIS specific terms  
-        "FIS", "AWS FIS", "experiment",
-        
-        # Additional related terms that should trigger activation
-        "chaos monkey", "chaos testing", "failure simulation",
-        "system resilience", "infrastructure testing"
-    }
+    return _REQUIRED_KEYWORDS
 
 
-@st.composite
-def generate_message_with_keywords(draw):
-    """Generate user messages containing chaos engineering keywords."""
-    # Select 1-3 keywords to include
-    available_keywords = list(get_required_keywords())
-    selected_keywords = draw(st.lists(
-        st.sampled_from(available_keywords),
-        min_size=1, max_size=3,
-        unique=True
-    ))
-    
-    # Generate message text around the keywords
-    prefix = draw(st.text(min_size=0, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Zs'))))
-    suffix = draw(st.text(min_size=0, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Zs'))))
-    
-    # Construct message with keywords
-    message_parts = [prefix.strip()] if prefix.strip() else []
-    message_parts.extend(selected_keywords)
-    if suffix.strip():
-        message_parts.append(suffix.strip())
-    
-    message = " ".join(message_parts)
-    
+# Filler text drawn around keywords; short, since longer junk adds no coverage
+_ALPHABET = st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Zs'))
+_FILLER_TEXT = st.text(alphabet=_ALPHABET, min_size=0, max_size=20)
+
+
+def _join_message(parts):
+    """Join (keywords, prefix, suffix) into a message, dropping blank filler."""
+    selected_keywords, prefix, suffix = parts
+    message = " ".join(filter(None, [prefix.strip(), *selected_keywords, suffix.strip()]))
     return message, selected_keywords
 
 
-@st.composite  
-def generate_message_without_keywords(draw):
+def generate_message_with_keywords():
+    """Generate user messages containing chaos engineering keywords."""
+    # Select 1-3 keywords to include, with message text around them
+    return st.tuples(
+        st.lists(st.sampled_from(_REQUIRED_KEYWORDS_TUPLE), min_size=1, max_size=3, unique=True),
+        _FILLER_TEXT,
+        _FILLER_TEXT
+    ).map(_join_message)
+
+
+# Terms whose case variants must match a configured keyword
+_KNOWN_TERMS = frozenset({"chaos", "engineering", "fault", "injection", "fis", "resilience"})
+
+# Case variations of configured keywords
+_KEYWORD_CASE_VARIANTS = (
+    "chaos engineering", "Chaos Engineering", "CHAOS ENGINEERING",
+    "fault injection", "Fault Injection", "FAULT INJECTION",
+    "fis", "FIS", "Fis",
+    "aws fis", "AWS FIS", "Aws Fis",
+    "resilience", "Resilience", "RESILIENCE"
+)
+
+
+# Words that don't contain any chaos engineering keywords
+_NON_TRIGGER_WORDS = (
+    "database", "application", "deployment", "monitoring", "logging",
+    "security", "performance", "optimization", "configuration", "backup",
+    "network", "storage", "compute", "analytics", "machine learning",
+    "development", "testing", "integration", "continuous", "pipeline"
+)
+
+
+def generate_message_without_keywords():
     """Generate user messages that should NOT trigger activation."""
-    # Generate text that doesn't contain any chaos engineering keywords
-    non_trigger_words = [
-        "database", "application", "deployment", "monitoring", "logging",
-        "security", "performance", "optimization", "configuration", "backup",
-        "network", "storage", "compute", "analytics", "machine learning",
-        "development", "testing", "integration", "continuous", "pipeline"
-    ]
-    
-    selected_words = draw(st.lists(
-        st.sampled_from(non_trigger_words),
+    return st.lists(
+        st.sampled_from(_NON_TRIGGER_WORDS),
         min_size=1, max_size=5
-    ))
-    
-    message = " ".join(selected_words)
-    
-    # Ensure message doesn't accidentally contain trigger keywords
-    trigger_keywords = get_required_keywords()
-    message_lower = message.lower()
-    
-    for keyword in trigger_keywords:
-        assume(keyword.lower() not in message_lower)
-    
-    return message
+    ).map(" ".join)
 
 
 class TestKeywordActivation:
     """Property-based tests for keyword activation."""
     
-    def _load_power_keywords(self) -> List[str]:
-        """Load keywords from POWER.md frontmatter."""
-        power_md_path = Path(__file__).parent.parent / "POWER.md"
-        
-        with open(power_md_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract frontmatter
-        if content.startswith('---'):
-            end_marker = content.find('---', 3)
-            if end_marker != -1:
-                frontmatter = content[3:end_marker]
-                try:
-                    metadata = yaml.safe_load(frontmatter)
-                    return metadata.get('keywords', [])
-                except yaml.YAMLError:
-                    return []
-        
-        return []
+    @pytest.fixture(scope="class")
+    def power_keywords_lower(self, frontmatter_dict: Dict[str, Any]) -> FrozenSet[str]:
+        """Lowercased keywords configured in POWER.md frontmatter."""
+        return frozenset(kw.lower() for kw in frontmatter_dict.get('keywords', []))
     
-    def test_power_md_contains_required_keywords(self):
+    def test_power_md_contains_required_keywords(self, power_keywords_lower: FrozenSet[str]):
         """Test that POWER.md frontmatter contains all required keywords."""
-        power_keywords = self._load_power_keywords()
-        required_keywords = get_required_keywords()
-        
-        # Convert to lowercase for case-insensitive comparison
-        power_keywords_lower = {kw.lower() for kw in power_keywords}
-        
-        # Check that all required keywords are present
-        missing_keywords = []
-        for required_keyword in required_keywords:
-            if required_keyword.lower() not in power_keywords_lower:
-                missing_keywords.append(required_keyword)
+        # Check that all required keywords are present (case-insensitive)
+        missing_keywords = _REQUIRED_KEYWORDS_LOWER - power_keywords_lower
         
-        assert len(missing_keywords) == 0, f"Missing required keywords in POWER.md: {missing_keywords}"
+        assert not missing_keywords, f"Missing required keywords in POWER.md: {sorted(missing_keywords)}"
     
-    def test_power_md_frontmatter_structure(self):
+    def test_power_md_frontmatter_structure(
+        self,
+        power_md_content: str,
+        frontmatter_match: Optional[re.Match],
+        frontmatter_dict: Dict[str, Any]
+    ):
         """Test that POWER.md has proper frontmatter structure for keyword activation."""
-        power_md_path = Path(__file__).parent.parent / "POWER.md"
-        
-        with open(power_md_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         # Verify frontmatter exists
-        assert content.startswith('---'), "POWER.md must start with YAML frontmatter"
-        
-        end_marker = content.find('---', 3)
-        assert end_marker != -1, "POWER.md frontmatter must be properly closed"
+        assert power_md_content.startswith('---'), "POWER.md must start with YAML frontmatter"
+        assert frontmatter_match is not None, "POWER.md frontmatter must be properly closed"
         
-        frontmatter = content[3:end_marker]
-        
-        # Parse frontmatter
-        try:
-            metadata = yaml.safe_load(frontmatter)
-        except yaml.YAMLError as e:
-            pytest.fail(f"Invalid YAML in POWER.md frontmatter: {e}")
+        metadata = frontmatter_dict
         
         # Verify required fields for Kiro Power
         required_fields = ['name', 'displayName', 'description', 'keywords', 'author']
@@ -155,8 +132,8 @@ class TestKeywordActivation:
     @given(
         message_data=generate_message_with_keywords()
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow])
-    def test_keyword_activation_property(self, message_data):
+    @settings(max_examples=25, deadline=None, suppress_health_check=[HealthCheck.too_slow, HealthCheck.data_too_large])
+    def test_keyword_activation_property(self, power_keywords_lower: FrozenSet[str], message_data):
         """
         **Feature: aws-chaos-engineering-kiro-power, Property 6: Keyword Activation**
         
@@ -167,10 +144,6 @@ class TestKeywordActivation:
         """
         message, selected_keywords = message_data
         
-        # Load configured keywords from POWER.md
-        power_keywords = self._load_power_keywords()
-        power_keywords_lower = {kw.lower() for kw in power_keywords}
-        
         # Verify that the message contains at least one configured keyword
         message_lower = message.lower()
         found_keywords = []
@@ -192,29 +165,45 @@ class TestKeywordActivation:
     @given(
         message=generate_message_without_keywords()
     )
-    @settings(max_examples=50)
-    def test_non_keyword_messages_should_not_activate(self, message):
+    @settings(max_examples=15)
+    def test_non_keyword_messages_should_not_activate(self, power_keywords_lower: FrozenSet[str], message):
         """Test that messages without chaos engineering keywords should not activate the power."""
-        # Load configured keywords from POWER.md
-        power_keywords = self._load_power_keywords()
-        power_keywords_lower = {kw.lower() for kw in power_keywords}
-        
         message_lower = message.lower()
         
-        # Verify message doesn't contain any configured keywords
-        found_keywords = []
-        for keyword in power_keywords_lower:
-            if keyword in message_lower:
-                found_keywords.append(keyword)
+        # Verify message doesn't contain any configured keywords from POWER.md
+        found_keywords = [keyword for keyword in power_keywords_lower if keyword in message_lower]
         
         # Property: Messages without keywords should not trigger activation
         assert len(found_keywords) == 0, f"Message '{message}' should not contain keywords but found: {found_keywords}"
     
-    def test_keyword_coverage_completeness(self):
-        """Test that keyword configuration covers all required activation scenarios."""
-        power_keywords = self._load_power_keywords()
-        power_keywords_lower = {kw.lower() for kw in power_keywords}
+    def test_non_trigger_words_cannot_form_configured_keywords(self, power_keywords_lower: FrozenSet[str]):
+        """Test that no message built from the non-trigger words can contain a configured keyword.
         
+        Messages are these words joined by single spaces, so a keyword occurrence either
+        fits inside two adjacent words or contains a whole word with a space on each side.
+        Ruling out both means generated messages never need filtering for keywords.
+        """
+        assert power_keywords_lower, "POWER.md frontmatter must configure activation keywords"
+        
+        adjacent_matches = [
+            (first, second, keyword)
+            for first in _NON_TRIGGER_WORDS
+            for second in _NON_TRIGGER_WORDS
+            for keyword in power_keywords_lower
+            if keyword in f"{first} {second}"
+        ]
+        assert not adjacent_matches, f"Adjacent non-trigger words must not form a configured keyword: {adjacent_matches}"
+        
+        contained_words = [
+            (word, keyword)
+            for word in _NON_TRIGGER_WORDS
+            for keyword in power_keywords_lower
+            if f" {word} " in keyword
+        ]
+        assert not contained_words, f"Configured keywords must not contain a whole non-trigger word: {contained_words}"
+    
+    def test_keyword_coverage_completeness(self, power_keywords_lower: FrozenSet[str]):
+        """Test that keyword configuration covers all required activation scenarios."""
         # Test scenarios that should trigger activation
         test_scenarios = [
             "I want to do chaos engineering on my system",
@@ -228,66 +217,30 @@ class TestKeywordActivation:
         
         for scenario in test_scenarios:
             scenario_lower = scenario.lower()
-            found_match = False
-            
-            for keyword in power_keywords_lower:
-                if keyword in scenario_lower:
-                    found_match = True
-                    break
+            found_match = any(keyword in scenario_lower for keyword in power_keywords_lower)
             
             assert found_match, f"Test scenario '{scenario}' should match at least one configured keyword"
     
     @given(
-        keyword_variations=st.lists(
-            st.sampled_from([
-                "chaos engineering", "Chaos Engineering", "CHAOS ENGINEERING",
-                "fault injection", "Fault Injection", "FAULT INJECTION", 
-                "fis", "FIS", "Fis",
-                "aws fis", "AWS FIS", "Aws Fis",
-                "resilience", "Resilience", "RESILIENCE"
-            ]),
-            min_size=1, max_size=3,
-            unique=True
-        )
+        keyword_variant=st.sampled_from(_KEYWORD_CASE_VARIANTS)
     )
-    @settings(max_examples=50)
-    def test_case_insensitive_keyword_matching(self, keyword_variations):
+    @settings(max_examples=len(_KEYWORD_CASE_VARIANTS))
+    def test_case_insensitive_keyword_matching(self, power_keywords_lower: FrozenSet[str], keyword_variant):
         """Test that keyword matching works regardless of case variations."""
-        power_keywords = self._load_power_keywords()
-        power_keywords_lower = {kw.lower() for kw in power_keywords}
-        
         # Test that case variations of configured keywords would be detected
-        for keyword_variant in keyword_variations:
-            keyword_lower = keyword_variant.lower()
-            
-            # Check if this variant matches any configured keyword
-            matches_configured = any(
-                configured_keyword in keyword_lower or keyword_lower in configured_keyword
-                for configured_keyword in power_keywords_lower
-            )
-            
-            # If it's a known chaos engineering term, it should match configuration
-            known_terms = {"chaos", "engineering", "fault", "injection", "fis", "resilience"}
-            if any(term in keyword_lower for term in known_terms):
-                assert matches_configured, f"Keyword variant '{keyword_variant}' should match power configuration"
-    
-    def test_keyword_documentation_consistency(self):
-        """Test that documented keywords in POWER.md content match frontmatter."""
-        power_md_path = Path(__file__).parent.parent / "POWER.md"
+        keyword_lower = keyword_variant.lower()
         
-        with open(power_md_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract frontmatter keywords
-        frontmatter_keywords = self._load_power_keywords()
-        frontmatter_keywords_lower = {kw.lower() for kw in frontmatter_keywords}
+        # Check if this variant matches a configured keyword
+        matches_configured = keyword_lower in power_keywords_lower
         
+        # If it's a known chaos engineering term, it should match configuration
+        if any(term in keyword_lower for term in _KNOWN_TERMS):
+            assert matches_configured, f"Keyword variant '{keyword_variant}' should match power configuration"
+    
+    def test_keyword_documentation_consistency(self, power_md_content: str, power_keywords_lower: FrozenSet[str]):
+        """Test that documented keywords in POWER.md content match frontmatter."""
         # Find the "Automatic Activation" section in the content
-        activation_section_match = re.search(
-            r'### Automatic Activation.*?(?=###|\Z)', 
-            content, 
-            re.DOTALL | re.IGNORECASE
-        )
+        activation_section_match = _ACTIVATION_RE.search(power_md_content)
         
         if activation_section_match:
             activation_section = activation_section_match.group(0)
@@ -296,6 +249,6 @@ class TestKeywordActivation:
             core_keywords = ["chaos engineering", "fault injection", "FIS", "resilience"]
             
             for keyword in core_keywords:
-                if keyword.lower() in frontmatter_keywords_lower:
+                if keyword.lower() in power_keywords_lower:
                     assert keyword.lower() in activation_section.lower(), \
                         f"Core keyword '{keyword}' should be documented in Automatic Activation section"
\ No newline at end of file
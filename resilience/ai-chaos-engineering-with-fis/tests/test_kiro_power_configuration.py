@@ -5,54 +5,87 @@ Tests mcp.json structure, POWER.md frontmatter and sections, and steering file c
 Validates Requirements 4.2, 4.3.
 """
 
-import json
 import os
 from pathlib import Path
 import pytest
 import re
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+from ._helpers import missing_phrases, phrase_pattern
+
+
+# MCP servers mcp.json must configure
+_REQUIRED_SERVERS = frozenset({"aws-chaos-engineering", "aws-mcp"})
+
+# Fields every mcp.json server entry must define
+_REQUIRED_SERVER_FIELDS = frozenset({"command", "args", "disabled"})
+
+# Fields POWER.md frontmatter must define for a Kiro Power
+_REQUIRED_FRONTMATTER_FIELDS = frozenset({"name", "displayName", "description", "keywords", "author"})
+
+# Activation keywords POWER.md frontmatter must list verbatim (case-insensitive)
+_REQUIRED_FRONTMATTER_KEYWORDS = frozenset({"chaos engineering", "fault injection", "fis"})
+
+# Required POWER.md sections
+_POWER_MD_SECTIONS = frozenset({
+    "# AWS Chaos Engineering Kiro Power",
+    "## Overview",
+    "## Available MCP Servers",
+    "## Tool Usage Examples",
+    "## Common Workflows",
+    "## Best Practices",
+    "## Configuration",
+    "## Troubleshooting"
+})
+_POWER_MD_SECTIONS_RE = phrase_pattern(_POWER_MD_SECTIONS)
+
+# Tools the aws-chaos-engineering server must expose and document
+_REQUIRED_TOOLS = frozenset({"get_valid_fis_actions", "validate_fis_template", "refresh_valid_fis_actions_cache"})
+_REQUIRED_TOOLS_RE = phrase_pattern(_REQUIRED_TOOLS)
+
+# Required steering/getting-started.md sections
+_GETTING_STARTED_SECTIONS = frozenset({
+    "# Getting Started with AWS Chaos Engineering",
+    "## Prerequisites",
+    "## Step 1: Power Activation",
+    "## Step 2: Describe Your Architecture",
+    "## Step 3: Review Generated Template",
+    "## Step 4: Safety Review",
+    "## Step 5: Deploy and Execute",
+    "## Safety Guidelines",
+    "## Troubleshooting"
+})
+_GETTING_STARTED_SECTIONS_RE = phrase_pattern(_GETTING_STARTED_SECTIONS)
+
+# Required steering/advanced-patterns.md sections
+_ADVANCED_PATTERNS_SECTIONS = frozenset({
+    "# Advanced Chaos Engineering Patterns",
+    "## Multi-Service Failure Scenarios",
+    "## Time-Based Experiment Patterns",
+    "## Application-Specific Patterns",
+    "## Advanced Safety Patterns",
+    "## Automation and CI/CD Integration",
+    "## Observability and Analysis Patterns"
+})
+_ADVANCED_PATTERNS_SECTIONS_RE = phrase_pattern(_ADVANCED_PATTERNS_SECTIONS)
+
+
+@lru_cache(maxsize=16)
+def _read_text(path: str, mtime: float, size: int) -> str:
+    """Read a UTF-8 file, cached by (path, mtime, size) so edits invalidate it."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+def _read_config_file(path: Path) -> str:
+    """Read a configuration file through the stat-keyed text cache."""
+    stat_result = os.stat(path)
+    return _read_text(str(path), stat_result.st_mtime, stat_result.st_size)
 
 
 class TestKiroPowerConfiguration:
     """Test suite for Kiro Power configuration validation."""
     
-    @pytest.fixture
-    def power_root(self) -> Path:
-        """Get the root directory of the Kiro Power."""
-        # Navigate from tests directory to power root
-        return Path(__file__).parent.parent
-    
-    @pytest.fixture
-    def mcp_json_path(self, power_root: Path) -> Path:
-        """Get path to mcp.json file."""
-        return power_root / "mcp.json"
-    
-    @pytest.fixture
-    def power_md_path(self, power_root: Path) -> Path:
-        """Get path to POWER.md file."""
-        return power_root / "POWER.md"
-    
-    @pytest.fixture
-    def steering_dir(self, power_root: Path) -> Path:
-        """Get path to steering directory."""
-        return power_root / "steering"
-    
-    @pytest.fixture
-    def mcp_config(self, mcp_json_path: Path) -> Dict[str, Any]:
-        """Load and parse mcp.json configuration."""
-        assert mcp_json_path.exists(), f"mcp.json not found at {mcp_json_path}"
-        
-        with open(mcp_json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    
-    @pytest.fixture
-    def power_md_content(self, power_md_path: Path) -> str:
-        """Load POWER.md content."""
-        assert power_md_path.exists(), f"POWER.md not found at {power_md_path}"
-        
-        with open(power_md_path, 'r', encoding='utf-8') as f:
-            return f.read()
-
     def test_mcp_json_structure_and_required_fields(self, mcp_config: Dict[str, Any]):
         """Test mcp.json has correct structure and all required fields."""
         # Test top-level structure
@@ -62,9 +95,8 @@ class TestKiroPowerConfiguration:
         mcp_servers = mcp_config["mcpServers"]
         
         # Test required servers are present
-        required_servers = ["aws-chaos-engineering", "aws-mcp"]
-        for server_name in required_servers:
-            assert server_name in mcp_servers, f"Required MCP server '{server_name}' not found in configuration"
+        missing_servers = _REQUIRED_SERVERS - mcp_servers.keys()
+        assert not missing_servers, f"Required MCP servers not found in configuration: {sorted(missing_servers)}"
         
         # Test aws-chaos-engineering server configuration
         aws_chaos_server = mcp_servers["aws-chaos-engineering"]
@@ -76,10 +108,8 @@ class TestKiroPowerConfiguration:
         assert aws_chaos_server["disabled"] is False, "aws-chaos-engineering server must not be disabled"
         
         # Test autoApprove contains required tools
-        required_tools = ["get_valid_fis_actions", "validate_fis_template", "refresh_valid_fis_actions_cache"]
-        auto_approve = aws_chaos_server.get("autoApprove", [])
-        for tool in required_tools:
-            assert tool in auto_approve, f"Required tool '{tool}' not in autoApprove list"
+        missing_tools = _REQUIRED_TOOLS - set(aws_chaos_server.get("autoApprove", []))
+        assert not missing_tools, f"Required tools not in autoApprove list: {sorted(missing_tools)}"
         
         # Test aws-mcp server configuration
         aws_mcp_server = mcp_servers["aws-mcp"]
@@ -94,9 +124,8 @@ class TestKiroPowerConfiguration:
     
     def _validate_server_config(self, server_config: Dict[str, Any], server_name: str):
         """Validate common server configuration fields."""
-        required_fields = ["command", "args", "disabled"]
-        for field in required_fields:
-            assert field in server_config, f"Server '{server_name}' missing required field '{field}'"
+        missing_fields = _REQUIRED_SERVER_FIELDS - server_config.keys()
+        assert not missing_fields, f"Server '{server_name}' missing required fields: {sorted(missing_fields)}"
         
         assert isinstance(server_config["args"], list), f"Server '{server_name}' args must be a list"
         assert len(server_config["args"]) > 0, f"Server '{server_name}' args cannot be empty"
@@ -105,39 +134,21 @@ class TestKiroPowerConfiguration:
         if "autoApprove" in server_config:
             assert isinstance(server_config["autoApprove"], list), f"Server '{server_name}' autoApprove must be a list"
 
-    def test_power_md_frontmatter_and_required_sections(self, power_md_content: str):
+    def test_power_md_frontmatter_and_required_sections(
+        self,
+        power_md_content: str,
+        frontmatter_match: Optional[re.Match],
+        frontmatter_dict: Dict[str, Any]
+    ):
         """Test POWER.md has correct frontmatter and all required sections."""
         # Test frontmatter exists and is valid YAML
-        frontmatter_match = re.match(r'^---\n(.*?)\n---\n', power_md_content, re.DOTALL)
         assert frontmatter_match, "POWER.md must start with YAML frontmatter between --- markers"
         
-        frontmatter_content = frontmatter_match.group(1)
-        
-        # Parse frontmatter (simple parsing for required fields)
-        frontmatter_lines = frontmatter_content.strip().split('\n')
-        frontmatter_dict = {}
-        
-        for line in frontmatter_lines:
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Handle quoted strings
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                # Handle arrays
-                elif value.startswith('[') and value.endswith(']'):
-                    # Simple array parsing for keywords
-                    value = [item.strip().strip('"') for item in value[1:-1].split(',') if item.strip()]
-                
-                frontmatter_dict[key] = value
-        
         # Test required frontmatter fields
-        required_frontmatter_fields = ["name", "displayName", "description", "keywords", "author"]
-        for field in required_frontmatter_fields:
-            assert field in frontmatter_dict, f"POWER.md frontmatter missing required field '{field}'"
-            assert frontmatter_dict[field], f"POWER.md frontmatter field '{field}' cannot be empty"
+        missing_fields = _REQUIRED_FRONTMATTER_FIELDS - frontmatter_dict.keys()
+        assert not missing_fields, f"POWER.md frontmatter missing required fields: {sorted(missing_fields)}"
+        empty_fields = {field for field in _REQUIRED_FRONTMATTER_FIELDS if not frontmatter_dict[field]}
+        assert not empty_fields, f"POWER.md frontmatter fields cannot be empty: {sorted(empty_fields)}"
         
         # Test specific frontmatter values
         assert frontmatter_dict["name"] == "aws-chaos-engineering", "POWER.md name must be 'aws-chaos-engineering'"
@@ -146,37 +157,24 @@ class TestKiroPowerConfiguration:
         assert len(frontmatter_dict["keywords"]) > 0, "POWER.md keywords cannot be empty"
         
         # Test chaos engineering keywords are present
-        keywords = [kw.lower() for kw in frontmatter_dict["keywords"]]
-        required_keywords = ["chaos engineering", "fault injection", "fis"]
-        for keyword in required_keywords:
-            assert any(keyword in kw for kw in keywords), f"POWER.md keywords must include '{keyword}'"
+        keywords = {kw.lower() for kw in frontmatter_dict["keywords"]}
+        missing_keywords = _REQUIRED_FRONTMATTER_KEYWORDS - keywords
+        assert not missing_keywords, f"POWER.md keywords must include: {sorted(missing_keywords)}"
         
         # Get content after frontmatter
         content_after_frontmatter = power_md_content[frontmatter_match.end():]
         
         # Test required sections are present
-        required_sections = [
-            "# AWS Chaos Engineering Kiro Power",
-            "## Overview", 
-            "## Available MCP Servers",
-            "## Tool Usage Examples",
-            "## Common Workflows",
-            "## Best Practices",
-            "## Configuration",
-            "## Troubleshooting"
-        ]
-        
-        for section in required_sections:
-            assert section in content_after_frontmatter, f"POWER.md missing required section '{section}'"
+        missing_sections = missing_phrases(_POWER_MD_SECTIONS_RE, _POWER_MD_SECTIONS, content_after_frontmatter)
+        assert not missing_sections, f"POWER.md missing required sections: {sorted(missing_sections)}"
         
         # Test MCP servers are documented
         assert "aws-chaos-engineering Server" in content_after_frontmatter, "POWER.md must document aws-chaos-engineering server"
         assert "aws-mcp Server" in content_after_frontmatter, "POWER.md must document aws-mcp server"
         
         # Test tools are documented
-        required_tools = ["get_valid_fis_actions", "validate_fis_template", "refresh_valid_fis_actions_cache"]
-        for tool in required_tools:
-            assert tool in content_after_frontmatter, f"POWER.md must document tool '{tool}'"
+        missing_tools = missing_phrases(_REQUIRED_TOOLS_RE, _REQUIRED_TOOLS, content_after_frontmatter)
+        assert not missing_tools, f"POWER.md must document tools: {sorted(missing_tools)}"
         
         # Test configuration sections
         assert "Prerequisites" in content_after_frontmatter, "POWER.md must include Prerequisites section"
@@ -197,35 +195,19 @@ class TestKiroPowerConfiguration:
             assert file_path.is_file(), f"Steering path '{filename}' must be a file"
         
         # Test getting-started.md content
-        getting_started_path = steering_dir / "getting-started.md"
-        with open(getting_started_path, 'r', encoding='utf-8') as f:
-            getting_started_content = f.read()
+        getting_started_content = _read_config_file(steering_dir / "getting-started.md")
         
         self._validate_getting_started_content(getting_started_content)
         
         # Test advanced-patterns.md content
-        advanced_patterns_path = steering_dir / "advanced-patterns.md"
-        with open(advanced_patterns_path, 'r', encoding='utf-8') as f:
-            advanced_patterns_content = f.read()
+        advanced_patterns_content = _read_config_file(steering_dir / "advanced-patterns.md")
         
         self._validate_advanced_patterns_content(advanced_patterns_content)
     
     def _validate_getting_started_content(self, content: str):
         """Validate getting-started.md has required sections and content."""
-        required_sections = [
-            "# Getting Started with AWS Chaos Engineering",
-            "## Prerequisites",
-            "## Step 1: Power Activation", 
-            "## Step 2: Describe Your Architecture",
-            "## Step 3: Review Generated Template",
-            "## Step 4: Safety Review",
-            "## Step 5: Deploy and Execute",
-            "## Safety Guidelines",
-            "## Troubleshooting"
-        ]
-        
-        for section in required_sections:
-            assert section in content, f"getting-started.md missing required section '{section}'"
+        missing_sections = missing_phrases(_GETTING_STARTED_SECTIONS_RE, _GETTING_STARTED_SECTIONS, content)
+        assert not missing_sections, f"getting-started.md missing required sections: {sorted(missing_sections)}"
         
         # Test specific content requirements
         assert "chaos engineering" in content.lower(), "getting-started.md must mention chaos engineering"
@@ -240,18 +222,8 @@ class TestKiroPowerConfiguration:
     
     def _validate_advanced_patterns_content(self, content: str):
         """Validate advanced-patterns.md has required sections and content."""
-        required_sections = [
-            "# Advanced Chaos Engineering Patterns",
-            "## Multi-Service Failure Scenarios",
-            "## Time-Based Experiment Patterns", 
-            "## Application-Specific Patterns",
-            "## Advanced Safety Patterns",
-            "## Automation and CI/CD Integration",
-            "## Observability and Analysis Patterns"
-        ]
-        
-        for section in required_sections:
-            assert section in content, f"advanced-patterns.md missing required section '{section}'"
+        missing_sections = missing_phrases(_ADVANCED_PATTERNS_SECTIONS_RE, _ADVANCED_PATTERNS_SECTIONS, content)
+        assert not missing_sections, f"advanced-patterns.md missing required sections: {sorted(missing_sections)}"
         
         # Test advanced concepts are covered
         advanced_concepts = ["Cascading Failure", "Multi-AZ", "Microservices", "CI/CD", "Game Day"]
@@ -269,24 +241,19 @@ class TestKiroPowerConfiguration:
         # Extract server names from mcp.json
         mcp_servers = mcp_config["mcpServers"]
         
-        # Test that all configured servers are documented in POWER.md
-        for server_name in mcp_servers.keys():
-            # Convert server name to expected documentation format
-            if server_name == "aws-chaos-engineering":
-                expected_doc = "aws-chaos-engineering Server"
-            elif server_name == "aws-mcp":
-                expected_doc = "aws-mcp Server"
-            else:
-                expected_doc = f"{server_name} Server"
-            
-            assert expected_doc in power_md_content, f"Server '{server_name}' from mcp.json not documented in POWER.md"
+        # Test that all configured servers are documented in POWER.md as "<name> Server"
+        undocumented_servers = [
+            server_name for server_name in mcp_servers
+            if f"{server_name} Server" not in power_md_content
+        ]
+        assert not undocumented_servers, f"Servers from mcp.json not documented in POWER.md: {sorted(undocumented_servers)}"
         
         # Test that autoApprove tools are documented
         aws_chaos_server = mcp_servers.get("aws-chaos-engineering", {})
         auto_approve_tools = aws_chaos_server.get("autoApprove", [])
         
-        for tool in auto_approve_tools:
-            assert tool in power_md_content, f"Auto-approved tool '{tool}' not documented in POWER.md"
+        undocumented_tools = [tool for tool in auto_approve_tools if tool not in power_md_content]
+        assert not undocumented_tools, f"Auto-approved tools not documented in POWER.md: {sorted(undocumented_tools)}"
 
     def test_file_permissions_and_encoding(self, power_root: Path):
         """Test that configuration files have proper permissions and encoding."""
@@ -305,8 +272,7 @@ class TestKiroPowerConfiguration:
             
             # Test file can be opened with UTF-8 encoding
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    assert len(content) > 0, f"Configuration file {file_path} is empty"
+                content = _read_config_file(file_path)
+                assert len(content) > 0, f"Configuration file {file_path} is empty"
             except UnicodeDecodeError:
                 pytest.fail(f"Configuration file {file_path} is not valid UTF-8")
\ No newline at end of file